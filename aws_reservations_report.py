@@ -9,14 +9,75 @@ This script retrieves and displays details about:
 
 Requirements:
 - boto3 library
+- Optional: aioboto3 (asyncio region sweep), orjson (faster JSON export)
 - AWS credentials configured (via AWS CLI, environment variables, or IAM roles)
 """
 
+import asyncio
 import boto3
 import json
-from datetime import datetime
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Optional faster JSON encoder; fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional asyncio client for the region sweep; fall back to a thread pool
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:
+    aioboto3 = None
+
+# Number of regions queried concurrently (thread pool / asyncio)
+MAX_WORKERS = 16
+MAX_CONCURRENT_REGIONS = 32
+
+# Use Cost Explorer reservation coverage to skip regions without reservations.
+# Off by default: it is a paid API and misses reservations that have not
+# covered any usage in the lookback window (e.g. newly purchased or unused)
+USE_COST_EXPLORER_PRECHECK = False
+COST_EXPLORER_LOOKBACK_DAYS = 30
+
+# Cost Explorer service names for the reservation types in this report
+COST_EXPLORER_SERVICES = [
+    'Amazon Elastic Compute Cloud - Compute',
+    'Amazon Relational Database Service'
+]
+
+# Shared client configuration. Adaptive retries rate-limit on the client side
+# so concurrent region workers back off together when throttled, and the pool
+# is sized to hold connections open across them
+CLIENT_CONFIG_OPTIONS = {
+    'retries': {'mode': 'adaptive', 'max_attempts': 10},
+    'max_pool_connections': 64,
+    'tcp_keepalive': True
+}
+CLIENT_CONFIG = Config(**CLIENT_CONFIG_OPTIONS)
+ASYNC_CLIENT_CONFIG = AioConfig(**CLIENT_CONFIG_OPTIONS) if aioboto3 else None
+
+# boto3 sessions are not thread-safe; every client the region workers use is
+# created through get_client while holding this lock
+_client_lock = threading.Lock()
+
+# Cached result of sts:GetCallerIdentity
+_caller_identity = None
+
+
+@lru_cache(maxsize=4096)
+def _strftime(dt):
+    """Cached strftime; reservations bought together share timestamps"""
+    return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
+
 
 def format_datetime(dt):
     """Format datetime object to readable string"""
@@ -25,15 +86,90 @@ def format_datetime(dt):
         if isinstance(dt, str):
             return dt
         # Handle datetime object
-        return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
+        return _strftime(dt)
     return 'N/A'
 
 
+# Detailed report layout per reservation type: (label, key or function of the
+# raw API item). Missing keys are shown as N/A
+REPORT_FIELDS = {
+    'EC2 Reserved Instance': [
+        ('Region', 'Region'),
+        ('ReservedInstancesId', 'ReservedInstancesId'),
+        ('InstanceType', 'InstanceType'),
+        ('AvailabilityZone', 'AvailabilityZone'),
+        ('State', 'State'),
+        ('Start', lambda r: format_datetime(r.get('Start'))),
+        ('End', lambda r: format_datetime(r.get('End'))),
+        ('Duration', lambda r: f"{r['Duration']} seconds"),
+        ('InstanceCount', 'InstanceCount'),
+        ('ProductDescription', 'ProductDescription'),
+        ('InstanceTenancy', 'InstanceTenancy'),
+        ('OfferingClass', 'OfferingClass'),
+        ('OfferingType', 'OfferingType'),
+        ('FixedPrice', lambda r: r.get('FixedPrice', 0)),
+        ('UsagePrice', lambda r: r.get('UsagePrice', 0)),
+        ('CurrencyCode', lambda r: r.get('CurrencyCode', 'USD'))
+    ],
+    'RDS Reserved Instance': [
+        ('Region', 'Region'),
+        ('ReservedDBInstanceId', 'ReservedDBInstanceId'),
+        ('DBInstanceClass', 'DBInstanceClass'),
+        ('Engine', 'ProductDescription'),
+        ('State', 'State'),
+        ('Start', lambda r: format_datetime(r.get('StartTime'))),
+        ('Duration', lambda r: f"{r['Duration']} seconds"),
+        ('DBInstanceCount', 'DBInstanceCount'),
+        ('OfferingType', 'OfferingType'),
+        ('MultiAZ', 'MultiAZ'),
+        ('FixedPrice', lambda r: r.get('FixedPrice', 0)),
+        ('UsagePrice', lambda r: r.get('UsagePrice', 0)),
+        ('CurrencyCode', lambda r: r.get('CurrencyCode', 'USD'))
+    ],
+    'Savings Plan': [
+        ('Region', 'Region'),
+        ('SavingsPlanId', 'savingsPlanId'),
+        ('SavingsPlanArn', 'savingsPlanArn'),
+        ('Description', 'description'),
+        ('State', 'state'),
+        ('PlanType', 'savingsPlanType'),
+        ('PaymentOption', 'paymentOption'),
+        ('Start', lambda r: format_datetime(r.get('start'))),
+        ('End', lambda r: format_datetime(r.get('end'))),
+        ('Commitment', lambda r: f"{r['commitment']} {r['currency']}/hour"),
+        ('Currency', 'currency'),
+        ('UpfrontPayment', 'upfrontPaymentAmount'),
+        ('RecurringPayment', 'recurringPaymentAmount'),
+        ('TermDurationInSeconds', 'termDurationInSeconds'),
+        ('EC2InstanceFamily', 'ec2InstanceFamily')
+    ]
+}
+
+
+@lru_cache(maxsize=None)
+def get_client(session, service, region=None):
+    """Get a cached boto3 client for a service and region"""
+    with _client_lock:
+        return session.client(service, region_name=region, config=CLIENT_CONFIG)
+
+
+def get_caller_identity(session):
+    """Get the STS caller identity, calling STS only once per run"""
+    global _caller_identity
+    if _caller_identity is None:
+        _caller_identity = get_client(session, 'sts').get_caller_identity()
+    return _caller_identity
+
+
 def get_all_regions(session):
-    """Get all available AWS regions"""
+    """Get all AWS regions enabled for this account"""
     try:
-        ec2 = session.client('ec2', region_name='us-east-1')  # Use us-east-1 to get all regions
-        response = ec2.describe_regions()
+        ec2 = get_client(session, 'ec2', 'us-east-1')  # Use us-east-1 to get all regions
+        # Without AllRegions=True only enabled regions are returned; the filter
+        # just makes that default explicit
+        response = ec2.describe_regions(
+            Filters=[{'Name': 'opt-in-status', 'Values': ['opt-in-not-required', 'opted-in']}]
+        )
         return [region['RegionName'] for region in response['Regions']]
     except ClientError as e:
         print(f"Error getting regions: {e}")
@@ -46,124 +182,261 @@ def get_all_regions(session):
         ]
 
 
+def get_reservation_regions(session):
+    """Get regions with Reserved Instance coverage according to Cost Explorer
+
+    Returns None if Cost Explorer cannot be queried, so callers can fall back
+    to checking every region.
+    """
+    try:
+        ce = get_client(session, 'ce', 'us-east-1')
+        end = datetime.now(timezone.utc).date()
+        start = end - timedelta(days=COST_EXPLORER_LOOKBACK_DAYS)
+        
+        regions = set()
+        # Cost Explorer only accepts a single SERVICE value per coverage query
+        for service in COST_EXPLORER_SERVICES:
+            kwargs = {
+                'TimePeriod': {'Start': start.isoformat(), 'End': end.isoformat()},
+                'GroupBy': [{'Type': 'DIMENSION', 'Key': 'REGION'}],
+                'Filter': {'Dimensions': {'Key': 'SERVICE', 'Values': [service]}}
+            }
+            while True:
+                response = ce.get_reservation_coverage(**kwargs)
+                for coverage in response['CoveragesByTime']:
+                    for group in coverage.get('Groups', []):
+                        hours = group.get('Coverage', {}).get('CoverageHours', {})
+                        if float(hours.get('ReservedHours', 0) or 0) > 0:
+                            regions.add(group['Attributes'].get('region'))
+                
+                next_token = response.get('NextPageToken')
+                if not next_token:
+                    break
+                kwargs['NextPageToken'] = next_token
+        
+        regions.discard(None)
+        return regions
+    
+    except ClientError as e:
+        print(f"Cost Explorer precheck unavailable, checking all regions: {e}")
+        return None
+
+
+def tag_reservation(item, reservation_type, region):
+    """Tag a raw API item with the report Type and Region keys"""
+    item['Type'] = reservation_type
+    item['Region'] = region
+    return item
+
+
+def handle_reservation_error(e, description, region):
+    """Report a ClientError from a reservation lookup, ignoring permission errors"""
+    if e.response['Error']['Code'] not in ['UnauthorizedOperation', 'AccessDenied']:
+        print(f"Error retrieving {description} in {region}: {e}")
+
+
 def get_ec2_reserved_instances(session, region):
     """Retrieve EC2 Reserved Instances for a specific region"""
     try:
-        ec2 = session.client('ec2', region_name=region)
-        response = ec2.describe_reserved_instances()
+        ec2 = get_client(session, 'ec2', region)
+        paginator = ec2.get_paginator('describe_reserved_instances')
         
         reserved_instances = []
-        for ri in response['ReservedInstances']:
-            reserved_instances.append({
-                'Type': 'EC2 Reserved Instance',
-                'Region': region,
-                'ReservedInstancesId': ri['ReservedInstancesId'],
-                'InstanceType': ri['InstanceType'],
-                'AvailabilityZone': ri.get('AvailabilityZone', 'N/A'),
-                'State': ri['State'],
-                'Start': format_datetime(ri.get('Start')),
-                'End': format_datetime(ri.get('End')),
-                'Duration': f"{ri['Duration']} seconds",
-                'InstanceCount': ri['InstanceCount'],
-                'ProductDescription': ri['ProductDescription'],
-                'InstanceTenancy': ri['InstanceTenancy'],
-                'OfferingClass': ri['OfferingClass'],
-                'OfferingType': ri['OfferingType'],
-                'FixedPrice': ri.get('FixedPrice', 0),
-                'UsagePrice': ri.get('UsagePrice', 0),
-                'CurrencyCode': ri.get('CurrencyCode', 'USD')
-            })
+        for page in paginator.paginate():
+            reserved_instances.extend([
+                tag_reservation(ri, 'EC2 Reserved Instance', region)
+                for ri in page['ReservedInstances']
+            ])
         
         return reserved_instances
     
     except ClientError as e:
-        if e.response['Error']['Code'] not in ['UnauthorizedOperation', 'AccessDenied']:
-            print(f"Error retrieving EC2 Reserved Instances in {region}: {e}")
+        handle_reservation_error(e, 'EC2 Reserved Instances', region)
         return []
 
 
 def get_rds_reserved_instances(session, region):
     """Retrieve RDS Reserved Instances for a specific region"""
     try:
-        rds = session.client('rds', region_name=region)
-        response = rds.describe_reserved_db_instances()
+        rds = get_client(session, 'rds', region)
+        paginator = rds.get_paginator('describe_reserved_db_instances')
         
         reserved_instances = []
-        for ri in response['ReservedDBInstances']:
-            reserved_instances.append({
-                'Type': 'RDS Reserved Instance',
-                'Region': region,
-                'ReservedDBInstanceId': ri['ReservedDBInstanceId'],
-                'DBInstanceClass': ri['DBInstanceClass'],
-                'Engine': ri['ProductDescription'],
-                'State': ri['State'],
-                'Start': format_datetime(ri.get('StartTime')),
-                'Duration': f"{ri['Duration']} seconds",
-                'DBInstanceCount': ri['DBInstanceCount'],
-                'OfferingType': ri['OfferingType'],
-                'MultiAZ': ri['MultiAZ'],
-                'FixedPrice': ri.get('FixedPrice', 0),
-                'UsagePrice': ri.get('UsagePrice', 0),
-                'CurrencyCode': ri.get('CurrencyCode', 'USD')
-            })
+        for page in paginator.paginate():
+            reserved_instances.extend([
+                tag_reservation(ri, 'RDS Reserved Instance', region)
+                for ri in page['ReservedDBInstances']
+            ])
         
         return reserved_instances
     
     except ClientError as e:
-        if e.response['Error']['Code'] not in ['UnauthorizedOperation', 'AccessDenied']:
-            print(f"Error retrieving RDS Reserved Instances in {region}: {e}")
+        handle_reservation_error(e, 'RDS Reserved Instances', region)
+        return []
+
+
+async def get_ec2_reserved_instances_async(session, region):
+    """Retrieve EC2 Reserved Instances for a specific region using aioboto3"""
+    try:
+        async with session.client('ec2', region_name=region, config=ASYNC_CLIENT_CONFIG) as ec2:
+            paginator = ec2.get_paginator('describe_reserved_instances')
+            
+            reserved_instances = []
+            async for page in paginator.paginate():
+                reserved_instances.extend([
+                    tag_reservation(ri, 'EC2 Reserved Instance', region)
+                    for ri in page['ReservedInstances']
+                ])
+            
+            return reserved_instances
+    
+    except ClientError as e:
+        handle_reservation_error(e, 'EC2 Reserved Instances', region)
+        return []
+
+
+async def get_rds_reserved_instances_async(session, region):
+    """Retrieve RDS Reserved Instances for a specific region using aioboto3"""
+    try:
+        async with session.client('rds', region_name=region, config=ASYNC_CLIENT_CONFIG) as rds:
+            paginator = rds.get_paginator('describe_reserved_db_instances')
+            
+            reserved_instances = []
+            async for page in paginator.paginate():
+                reserved_instances.extend([
+                    tag_reservation(ri, 'RDS Reserved Instance', region)
+                    for ri in page['ReservedDBInstances']
+                ])
+            
+            return reserved_instances
+    
+    except ClientError as e:
+        handle_reservation_error(e, 'RDS Reserved Instances', region)
         return []
 
 
-def get_savings_plans(session, region):
-    """Retrieve Savings Plans for a specific region"""
+def get_savings_plans(session):
+    """Retrieve Savings Plans from the global Savings Plans endpoint"""
     try:
-        savingsplans = session.client('savingsplans', region_name=region)
-        response = savingsplans.describe_savings_plans()
+        # Savings Plans is a global service; every region returns the same plans
+        savingsplans = get_client(session, 'savingsplans', 'us-east-1')
         
+        # Savings Plans has no paginator model, so follow nextToken manually
         savings_plans = []
-        for sp in response['savingsPlans']:
-            savings_plans.append({
-                'Type': 'Savings Plan',
-                'Region': region,
-                'SavingsPlanId': sp['savingsPlanId'],
-                'SavingsPlanArn': sp['savingsPlanArn'],
-                'Description': sp.get('description', 'N/A'),
-                'State': sp['state'],
-                'PlanType': sp['savingsPlanType'],
-                'PaymentOption': sp['paymentOption'],
-                'Start': format_datetime(sp.get('start')),
-                'End': format_datetime(sp.get('end')),
-                'Commitment': f"{sp['commitment']} {sp['currency']}/hour",
-                'Currency': sp['currency'],
-                'UpfrontPayment': sp.get('upfrontPaymentAmount', 'N/A'),
-                'RecurringPayment': sp.get('recurringPaymentAmount', 'N/A'),
-                'TermDurationInSeconds': sp.get('termDurationInSeconds', 'N/A'),
-                'EC2InstanceFamily': sp.get('ec2InstanceFamily', 'N/A'),
-                'Region': sp.get('region', 'N/A')
-            })
+        kwargs = {}
+        while True:
+            response = savingsplans.describe_savings_plans(**kwargs)
+            savings_plans.extend([
+                tag_reservation(sp, 'Savings Plan', sp.get('region', 'N/A'))
+                for sp in response['savingsPlans']
+            ])
+            
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            kwargs['nextToken'] = next_token
         
         return savings_plans
     
     except ClientError as e:
         if e.response['Error']['Code'] not in ['UnauthorizedOperation', 'AccessDenied']:
-            print(f"Error retrieving Savings Plans in {region}: {e}")
+            print(f"Error retrieving Savings Plans: {e}")
         return []
 
 
-def print_summary(all_reservations):
+def get_region_reservations(session, region):
+    """Retrieve EC2 and RDS Reserved Instances for a specific region"""
+    region_reservations = []
+    region_reservations.extend(get_ec2_reserved_instances(session, region))
+    region_reservations.extend(get_rds_reserved_instances(session, region))
+    return region_reservations
+
+
+async def get_region_reservations_async(session, region, semaphore):
+    """Retrieve EC2 and RDS Reserved Instances for a specific region using aioboto3"""
+    async with semaphore:
+        ec2_reservations, rds_reservations = await asyncio.gather(
+            get_ec2_reserved_instances_async(session, region),
+            get_rds_reserved_instances_async(session, region)
+        )
+    return region, ec2_reservations + rds_reservations
+
+
+def print_region_result(region, region_reservations):
+    """Print the progress line for a checked region"""
+    if region_reservations:
+        print(f"  Found {len(region_reservations)} reservations in {region}")
+    else:
+        print(f"  No reservations found in {region}")
+
+
+def collect_region_reservations(session, regions):
+    """Check regions concurrently with a thread pool, returning reservations by region"""
+    # Resolve credentials once before the workers share the session, so they
+    # never race on the credential provider chain
+    session.get_credentials()
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_region_reservations, session, region): region
+            for region in regions
+        }
+        for future in as_completed(futures):
+            region = futures[future]
+            results[region] = future.result()
+            print_region_result(region, results[region])
+    return results
+
+
+async def collect_region_reservations_async(session, regions):
+    """Check regions concurrently with asyncio, returning reservations by region"""
+    # Build the aioboto3 session from the boto3 session's credentials so both
+    # paths report on the same account
+    credentials = session.get_credentials()
+    if credentials is None:
+        raise NoCredentialsError()
+    credentials = credentials.get_frozen_credentials()
+    session = aioboto3.Session(
+        aws_access_key_id=credentials.access_key,
+        aws_secret_access_key=credentials.secret_key,
+        aws_session_token=credentials.token,
+        region_name=session.region_name
+    )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REGIONS)
+    tasks = [get_region_reservations_async(session, region, semaphore) for region in regions]
+    
+    results = {}
+    for task in asyncio.as_completed(tasks):
+        region, region_reservations = await task
+        results[region] = region_reservations
+        print_region_result(region, region_reservations)
+    return results
+
+
+def count_reservations(reservations, counts, region_counts):
+    """Add reservations to the running per-type and per-region counts"""
+    for r in reservations:
+        counts[r['Type']] += 1
+        region_counts[r.get('Region')] += 1
+
+
+def print_summary(counts):
     """Print a summary of all reservations"""
-    ec2_count = len([r for r in all_reservations if r['Type'] == 'EC2 Reserved Instance'])
-    rds_count = len([r for r in all_reservations if r['Type'] == 'RDS Reserved Instance'])
-    sp_count = len([r for r in all_reservations if r['Type'] == 'Savings Plan'])
+    ec2_count = counts.get('EC2 Reserved Instance', 0)
+    rds_count = counts.get('RDS Reserved Instance', 0)
+    sp_count = counts.get('Savings Plan', 0)
     
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
-    print(f"EC2 Reserved Instances: {ec2_count}")
-    print(f"RDS Reserved Instances: {rds_count}")
-    print(f"Savings Plans: {sp_count}")
-    print(f"Total Reservations: {len(all_reservations)}")
+    lines = [
+        "\n" + "="*80,
+        "SUMMARY",
+        "="*80,
+        f"EC2 Reserved Instances: {ec2_count}",
+        f"RDS Reserved Instances: {rds_count}",
+        f"Savings Plans: {sp_count}",
+        f"Total Reservations: {sum(counts.values())}"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_detailed_report(all_reservations):
@@ -172,24 +445,42 @@ def print_detailed_report(all_reservations):
         print("No Reserved Instances or Savings Plans found in this account.")
         return
     
-    print("\n" + "="*80)
-    print("DETAILED REPORT")
-    print("="*80)
+    # Build the whole report first and write it once instead of per line
+    lines = ["\n" + "="*80, "DETAILED REPORT", "="*80]
     
     for reservation in all_reservations:
-        print(f"\n{reservation['Type']}:")
-        print("-" * 40)
+        lines.append(f"\n{reservation['Type']}:")
+        lines.append("-" * 40)
         
-        for key, value in reservation.items():
-            if key != 'Type':
-                print(f"  {key}: {value}")
+        for label, field in REPORT_FIELDS[reservation['Type']]:
+            value = field(reservation) if callable(field) else reservation.get(field, 'N/A')
+            lines.append(f"  {label}: {value}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def json_default(value):
+    """Encode values JSON does not support, writing datetimes as orjson does"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return str(value)
+
+
+def dumps_json(data):
+    """Serialize data to indented JSON bytes using the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(data, default=json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+    return json.dumps(data, indent=2, default=json_default).encode('utf-8')
 
 
 def save_to_json(all_reservations, filename='aws_reservations_report.json'):
     """Save the report to a JSON file"""
     try:
-        with open(filename, 'w') as f:
-            json.dump(all_reservations, f, indent=2, default=str)
+        data = dumps_json(all_reservations)
+        with open(filename, 'wb') as f:
+            f.write(data)
         print(f"\nReport saved to: {filename}")
     except Exception as e:
         print(f"Error saving to JSON: {e}")
@@ -202,8 +493,7 @@ def main():
         session = boto3.Session()
         
         # Get current AWS account ID
-        sts = session.client('sts')
-        account_info = sts.get_caller_identity()
+        account_info = get_caller_identity(session)
         account_id = account_info['Account']
         
         print("AWS Reserved Instances and Savings Plans Report")
@@ -214,37 +504,44 @@ def main():
         # Get all AWS regions
         print("\nGetting list of AWS regions...")
         regions = get_all_regions(session)
+        
+        if USE_COST_EXPLORER_PRECHECK:
+            print("Checking Cost Explorer for regions with reservation coverage...")
+            covered_regions = get_reservation_regions(session)
+            if covered_regions is not None:
+                regions = [region for region in regions if region in covered_regions]
+        
         print(f"Checking {len(regions)} regions for reservations...")
         
         # Collect all reservation data across all regions
         all_reservations = []
         regions_with_data = set()
         
+        # Counts are kept up to date as reservations are collected
+        counts = defaultdict(int)
+        region_counts = defaultdict(int)
+        
         # Get Savings Plans once (they're account-level, not region-specific)
         print("\nChecking for Savings Plans (account-level)...")
-        savings_plans = get_savings_plans(session, 'us-east-1')
+        savings_plans = get_savings_plans(session)
         if savings_plans:
             print(f"  Found {len(savings_plans)} Savings Plan(s)")
             all_reservations.extend(savings_plans)
+            count_reservations(savings_plans, counts, region_counts)
+        
+        # Check regions concurrently; results are merged in region order below
+        print("\nChecking regions for EC2 and RDS Reserved Instances...")
+        if aioboto3 is not None:
+            results = asyncio.run(collect_region_reservations_async(session, regions))
+        else:
+            results = collect_region_reservations(session, regions)
         
         for region in regions:
-            print(f"\nChecking region: {region}")
-            region_reservations = []
-            
-            # Get EC2 Reserved Instances
-            ec2_reservations = get_ec2_reserved_instances(session, region)
-            region_reservations.extend(ec2_reservations)
-            
-            # Get RDS Reserved Instances
-            rds_reservations = get_rds_reserved_instances(session, region)
-            region_reservations.extend(rds_reservations)
-            
+            region_reservations = results[region]
             if region_reservations:
                 regions_with_data.add(region)
-                print(f"  Found {len(region_reservations)} reservations in {region}")
                 all_reservations.extend(region_reservations)
-            else:
-                print(f"  No reservations found in {region}")
+                count_reservations(region_reservations, counts, region_counts)
         
         # Display results
         print(f"\n" + "="*80)
@@ -252,12 +549,11 @@ def main():
         print("="*80)
         if regions_with_data:
             for region in sorted(regions_with_data):
-                region_count = len([r for r in all_reservations if r.get('Region') == region])
-                print(f"  {region}: {region_count} reservations")
+                print(f"  {region}: {region_counts[region]} reservations")
         else:
             print("No regions found with reservations")
         
-        print_summary(all_reservations)
+        print_summary(counts)
         print_detailed_report(all_reservations)
         
         # Save to JSON file